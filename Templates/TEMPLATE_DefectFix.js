@@ -295,12 +295,17 @@ const doc = new Document({
 });
 
 // ===== WRITE OUTPUT FILE =====
+// Write to a sibling temp file and rename it into place, so the output path only ever holds a complete .docx
+const tempDocxPath = `${outputDocxPath}.tmp`;
+
 docx.Packer.toBuffer(doc).then((buffer) => {
-  fs.writeFileSync(outputDocxPath, buffer);
+  fs.writeFileSync(tempDocxPath, buffer);
+  fs.renameSync(tempDocxPath, outputDocxPath);
   console.log(`✅ Document created successfully: ${outputDocxPath}`);
   console.log(`📄 Template: Defect Fix`);
   console.log(`📊 Size: ${buffer.length} bytes`);
 }).catch((error) => {
+  fs.rmSync(tempDocxPath, { force: true });
   console.error(`ERROR: Failed to generate document: ${error.message}`);
   process.exit(1);
 });
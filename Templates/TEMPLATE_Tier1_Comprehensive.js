@@ -44,6 +44,32 @@ try {
   process.exit(1);
 }
 
+// ===== LAYOUT CONSTANTS =====
+// Built once at load and shared by every divider paragraph
+const DIVIDER_TEXT = "━".repeat(80);
+
+// Table border sets shared by every table instead of rebuilt per table
+const BORDER_COLOR = "000000";
+const THIN_BORDER = { style: BorderStyle.SINGLE, size: 1, color: BORDER_COLOR };
+
+const BOX_BORDERS = { top: THIN_BORDER, bottom: THIN_BORDER, left: THIN_BORDER, right: THIN_BORDER };
+
+const GRID_BORDERS = {
+  top: THIN_BORDER,
+  bottom: THIN_BORDER,
+  left: THIN_BORDER,
+  right: THIN_BORDER,
+  insideHorizontal: THIN_BORDER,
+  insideVertical: THIN_BORDER
+};
+
+// Spacing, width and bullet options reused by every paragraph, cell and table
+const SPACE_AFTER = Object.fromEntries([100, 150, 200, 400, 600].map(n => [n, { after: n }]));
+const PERCENT_WIDTH = Object.fromEntries([15, 20, 30, 40, 50, 55, 60, 100].map(n => [n, { size: n, type: WidthType.PERCENTAGE }]));
+const BULLET = { level: 0 };
+// Bold sub-labels that follow a bullet list within a section
+const SUBHEADING_SPACING = { before: 100, after: 100 };
+
 // ===== HELPER FUNCTIONS =====
 function ensureArray(value) {
   if (!value) return [];
@@ -54,6 +80,52 @@ function ensureString(value, defaultValue = "") {
   return value !== null && value !== undefined ? String(value) : defaultValue;
 }
 
+const SECTION_HEADER_SPACING = { before: 400, after: 200 };
+
+let sectionNumber = 0;
+
+function sectionHeader(title) {
+  sectionNumber += 1;
+  return new Paragraph({ text: `${sectionNumber}. ${title}`, heading: HeadingLevel.HEADING_2, spacing: SECTION_HEADER_SPACING });
+}
+
+// Emits nothing for an empty list, so the section is skipped and later sections keep contiguous numbers
+function optionalSection(title, items, render) {
+  if (items.length === 0) return [];
+  return [sectionHeader(title), ...render(items)];
+}
+
+// Builds a plain data row with one single-paragraph cell per value
+function textRow(values) {
+  return new TableRow({
+    children: values.map(value => new TableCell({ children: [new Paragraph(ensureString(value))] }))
+  });
+}
+
+// ===== INPUT NORMALIZATION =====
+// Resolve field aliases, list shapes and row values once, so every section below iterates plain arrays
+const dependencies = procedureData.dependencies || {};
+const errorHandling = procedureData.errorHandling || {};
+
+const primaryOperations = ensureArray(procedureData.primaryOperations).map((op, idx) => `${idx + 1}. ${ensureString(op)}`);
+const parameterRows = ensureArray(procedureData.parameters).map(param =>
+  [param.name, param.type, ensureString(param.required, "No"), param.description]
+);
+const sideEffects = ensureArray(procedureData.sideEffects);
+const executionSteps = ensureArray(procedureData.executionSteps || procedureData.executionLogic).map(step =>
+  typeof step === 'object' ? `${step.step}: ${step.description}` : ensureString(step)
+);
+const qualityRules = ensureArray(procedureData.qualityRules);
+const sourceTables = ensureArray(procedureData.sourceTables || dependencies.sourceTables);
+const targetTables = ensureArray(procedureData.targetTables || dependencies.targetTables);
+const controlTables = ensureArray(procedureData.controlTables);
+const externalProcedures = ensureArray(procedureData.externalProcedures || dependencies.procedures);
+const currentErrorHandling = ensureArray(errorHandling.currentImplementation);
+const errorRecommendations = ensureArray(errorHandling.recommendations);
+const performanceMetricRows = ensureArray(procedureData.performanceMetrics).map(metric => [metric.metric, metric.value]);
+const usageExamples = ensureArray(procedureData.usageExamples);
+const changeHistoryRows = ensureArray(procedureData.changeHistory).map(change => [change.date, change.author, change.ticket, change.description]);
+
 // ===== DOCUMENT GENERATION =====
 const doc = new Document({
   sections: [{
@@ -64,277 +136,222 @@ const doc = new Document({
         text: "Stored Procedure Documentation",
         heading: HeadingLevel.HEADING_1,
         alignment: AlignmentType.CENTER,
-        spacing: { after: 400 }
+        spacing: SPACE_AFTER[400]
       }),
 
       new Paragraph({
         text: ensureString(procedureData.procedureName, "Untitled Procedure"),
         heading: HeadingLevel.HEADING_2,
         alignment: AlignmentType.CENTER,
-        spacing: { after: 600 }
+        spacing: SPACE_AFTER[600]
       }),
 
       // Header Summary Box
       new Paragraph({
-        text: "━".repeat(80),
-        spacing: { after: 100 }
+        text: DIVIDER_TEXT,
+        spacing: SPACE_AFTER[100]
       }),
 
       new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 1, color: "000000" }
-        },
+        width: PERCENT_WIDTH[100],
+        borders: BOX_BORDERS,
         rows: [
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Schema", bold: true })], width: { size: 20, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph(ensureString(procedureData.schema))], width: { size: 30, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Version", bold: true })], width: { size: 20, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph(ensureString(procedureData.version, "1.0"))], width: { size: 30, type: WidthType.PERCENTAGE } })
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Schema", bold: true })] })], width: PERCENT_WIDTH[20] }),
+              new TableCell({ children: [new Paragraph(ensureString(procedureData.schema))], width: PERCENT_WIDTH[30] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Version", bold: true })] })], width: PERCENT_WIDTH[20] }),
+              new TableCell({ children: [new Paragraph(ensureString(procedureData.version, "1.0"))], width: PERCENT_WIDTH[30] })
             ]
           }),
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Author", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Author", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.author))] }),
-              new TableCell({ children: [new Paragraph({ text: "Ticket", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Ticket", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.ticket))] })
             ]
           }),
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Created", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Created", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.created))] }),
-              new TableCell({ children: [new Paragraph({ text: "Last Modified", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Last Modified", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.lastModified, procedureData.created))] })
             ]
           }),
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Frequency", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Frequency", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.frequency, "N/A"))] }),
-              new TableCell({ children: [new Paragraph({ text: "Avg Duration", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Avg Duration", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.avgDuration, "N/A"))] })
             ]
           })
         ]
       }),
 
-      new Paragraph({ text: "━".repeat(80), spacing: { before: 100, after: 600 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: { before: 100, after: 600 } }),
 
-      // Section 1: Overview & Purpose
-      new Paragraph({ text: "1. OVERVIEW & PURPOSE", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
+      // Overview & Purpose
+      sectionHeader("OVERVIEW & PURPOSE"),
 
       new Paragraph({
         children: [
           new TextRun({ text: "Business Function: ", bold: true }),
           new TextRun(ensureString(procedureData.businessFunction || procedureData.purpose, "No description provided"))
         ],
-        spacing: { after: 200 }
+        spacing: SPACE_AFTER[200]
       }),
 
-      new Paragraph({ children: [new TextRun({ text: "Primary Operations:", bold: true })], spacing: { after: 100 } }),
-      ...ensureArray(procedureData.primaryOperations).map((op, idx) =>
-        new Paragraph({ text: `${idx + 1}. ${ensureString(op)}`, spacing: { after: 100 } })
-      ),
+      new Paragraph({ children: [new TextRun({ text: "Primary Operations:", bold: true })], spacing: SPACE_AFTER[100] }),
+      ...primaryOperations.map(operation => new Paragraph({ text: operation, spacing: SPACE_AFTER[100] })),
 
-      new Paragraph({ text: ensureString(procedureData.consolidationSummary, ""), spacing: { after: 400 } }),
+      new Paragraph({ text: ensureString(procedureData.consolidationSummary, ""), spacing: SPACE_AFTER[400] }),
 
-      // Section 2: Parameters
-      new Paragraph({ text: "2. PARAMETERS", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
-
-      new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideHorizontal: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideVertical: { style: BorderStyle.SINGLE, size: 1, color: "000000" }
-        },
-        rows: [
-          new TableRow({
-            tableHeader: true,
-            children: [
-              new TableCell({ children: [new Paragraph({ text: "Parameter", bold: true })], width: { size: 20, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Data Type", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Required", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Description", bold: true })], width: { size: 50, type: WidthType.PERCENTAGE } })
-            ]
-          }),
-          ...ensureArray(procedureData.parameters).map(param =>
+      // Parameters
+      ...optionalSection("PARAMETERS", parameterRows, rows => [
+        new Table({
+          width: PERCENT_WIDTH[100],
+          borders: GRID_BORDERS,
+          rows: [
             new TableRow({
+              tableHeader: true,
               children: [
-                new TableCell({ children: [new Paragraph(ensureString(param.name))] }),
-                new TableCell({ children: [new Paragraph(ensureString(param.type))] }),
-                new TableCell({ children: [new Paragraph(ensureString(param.required, "No"))] }),
-                new TableCell({ children: [new Paragraph(ensureString(param.description))] })
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Parameter", bold: true })] })], width: PERCENT_WIDTH[20] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Data Type", bold: true })] })], width: PERCENT_WIDTH[15] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Required", bold: true })] })], width: PERCENT_WIDTH[15] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Description", bold: true })] })], width: PERCENT_WIDTH[50] })
               ]
-            })
-          )
-        ]
-      }),
+            }),
+            ...rows.map(row => textRow(row))
+          ]
+        }),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
-
-      // Section 3: Return Values & Output
-      new Paragraph({ text: "3. RETURN VALUES & OUTPUT", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
-      new Paragraph({ children: [new TextRun({ text: "Return Value: ", bold: true }), new TextRun(ensureString(procedureData.returnValue, "None"))], spacing: { after: 100 } }),
-      new Paragraph({ children: [new TextRun({ text: "Result Sets: ", bold: true }), new TextRun(ensureString(procedureData.resultSets, "None"))], spacing: { after: 100 } }),
-      new Paragraph({ children: [new TextRun({ text: "Side Effects:", bold: true })], spacing: { after: 100 } }),
-      ...ensureArray(procedureData.sideEffects).map(effect => new Paragraph({ text: ensureString(effect), bullet: { level: 0 }, spacing: { after: 100 } })),
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
+      ]),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+      // Return Values & Output
+      sectionHeader("RETURN VALUES & OUTPUT"),
+      new Paragraph({ children: [new TextRun({ text: "Return Value: ", bold: true }), new TextRun(ensureString(procedureData.returnValue, "None"))], spacing: SPACE_AFTER[100] }),
+      new Paragraph({ children: [new TextRun({ text: "Result Sets: ", bold: true }), new TextRun(ensureString(procedureData.resultSets, "None"))], spacing: SPACE_AFTER[100] }),
+      new Paragraph({ children: [new TextRun({ text: "Side Effects:", bold: true })], spacing: SPACE_AFTER[100] }),
+      ...sideEffects.map(effect => new Paragraph({ text: ensureString(effect), bullet: BULLET, spacing: SPACE_AFTER[100] })),
 
-      // Section 4: Execution Flow
-      new Paragraph({ text: "4. EXECUTION FLOW", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
-      ...ensureArray(procedureData.executionSteps || procedureData.executionLogic).map(step => {
-        const stepText = typeof step === 'object' ? `${step.step}: ${step.description}` : ensureString(step);
-        return new Paragraph({ text: stepText, spacing: { after: 150 } });
-      }),
+      new Paragraph({ text: "", spacing: SPACE_AFTER[400] }),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+      // Execution Flow
+      ...optionalSection("EXECUTION FLOW", executionSteps, steps => [
+        ...steps.map(stepText => new Paragraph({ text: stepText, spacing: SPACE_AFTER[150] })),
 
-      // Section 5: Data Quality Rules
-      new Paragraph({ text: "5. DATA QUALITY RULES", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
-      ...ensureArray(procedureData.qualityRules).flatMap(qr => [
-        new Paragraph({ children: [new TextRun({ text: ensureString(qr.category), bold: true })], spacing: { after: 100 } }),
-        ...ensureArray(qr.rules).map(rule => new Paragraph({ text: ensureString(rule), bullet: { level: 0 }, spacing: { after: 100 } }))
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
       ]),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+      // Data Quality Rules
+      ...optionalSection("DATA QUALITY RULES", qualityRules, rules => [
+        ...rules.flatMap(qr => [
+          new Paragraph({ children: [new TextRun({ text: ensureString(qr.category), bold: true })], spacing: SPACE_AFTER[100] }),
+          ...ensureArray(qr.rules).map(rule => new Paragraph({ text: ensureString(rule), bullet: BULLET, spacing: SPACE_AFTER[100] }))
+        ]),
 
-      // Section 6: Dependencies
-      new Paragraph({ text: "6. DEPENDENCIES", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
+      ]),
 
-      new Paragraph({ children: [new TextRun({ text: "Source Tables:", bold: true })], spacing: { after: 100 } }),
-      ...ensureArray(procedureData.sourceTables || (procedureData.dependencies && procedureData.dependencies.sourceTables)).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
-      ),
+      // Dependencies
+      sectionHeader("DEPENDENCIES"),
 
-      new Paragraph({ children: [new TextRun({ text: "Target Tables:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.targetTables || (procedureData.dependencies && procedureData.dependencies.targetTables)).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Source Tables:", bold: true })], spacing: SPACE_AFTER[100] }),
+      ...sourceTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ children: [new TextRun({ text: "Control Tables:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.controlTables).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Target Tables:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...targetTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ children: [new TextRun({ text: "External Procedures:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.externalProcedures || (procedureData.dependencies && procedureData.dependencies.procedures)).map(proc =>
-        new Paragraph({ text: ensureString(proc), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Control Tables:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...controlTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+      new Paragraph({ children: [new TextRun({ text: "External Procedures:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...externalProcedures.map(proc =>
+        new Paragraph({ text: ensureString(proc), bullet: BULLET, spacing: SPACE_AFTER[100] })
+      ),
 
-      // Section 7: Performance Metrics
-      new Paragraph({ text: "7. PERFORMANCE METRICS", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
+      new Paragraph({ text: "", spacing: SPACE_AFTER[400] }),
 
-      new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideHorizontal: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideVertical: { style: BorderStyle.SINGLE, size: 1, color: "000000" }
-        },
-        rows: [
-          new TableRow({
-            tableHeader: true,
-            children: [
-              new TableCell({ children: [new Paragraph({ text: "Metric", bold: true })], width: { size: 40, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Value", bold: true })], width: { size: 60, type: WidthType.PERCENTAGE } })
-            ]
-          }),
-          ...ensureArray(procedureData.performanceMetrics).map(metric =>
+      // Performance Metrics
+      ...optionalSection("PERFORMANCE METRICS", performanceMetricRows, rows => [
+        new Table({
+          width: PERCENT_WIDTH[100],
+          borders: GRID_BORDERS,
+          rows: [
             new TableRow({
+              tableHeader: true,
               children: [
-                new TableCell({ children: [new Paragraph(ensureString(metric.metric))] }),
-                new TableCell({ children: [new Paragraph(ensureString(metric.value))] })
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Metric", bold: true })] })], width: PERCENT_WIDTH[40] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Value", bold: true })] })], width: PERCENT_WIDTH[60] })
               ]
-            })
-          )
-        ]
-      }),
+            }),
+            ...rows.map(row => textRow(row))
+          ]
+        }),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
+      ]),
 
-      // Section 8: Error Handling
-      new Paragraph({ text: "8. ERROR HANDLING", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
+      // Error Handling
+      sectionHeader("ERROR HANDLING"),
 
-      new Paragraph({ children: [new TextRun({ text: "Current Implementation:", bold: true })], spacing: { after: 100 } }),
-      ...ensureArray(procedureData.errorHandling && procedureData.errorHandling.currentImplementation).map(item =>
-        new Paragraph({ text: ensureString(item), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Current Implementation:", bold: true })], spacing: SPACE_AFTER[100] }),
+      ...currentErrorHandling.map(item =>
+        new Paragraph({ text: ensureString(item), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ children: [new TextRun({ text: "Recommendations:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.errorHandling && procedureData.errorHandling.recommendations).map(item =>
-        new Paragraph({ text: ensureString(item), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Recommendations:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...errorRecommendations.map(item =>
+        new Paragraph({ text: ensureString(item), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+      new Paragraph({ text: "", spacing: SPACE_AFTER[400] }),
 
-      // Section 9: Usage Examples
-      new Paragraph({ text: "9. USAGE EXAMPLES", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
+      // Usage Examples
+      ...optionalSection("USAGE EXAMPLES", usageExamples, examples => [
+        ...examples.flatMap(example => [
+          new Paragraph({ children: [new TextRun({ text: ensureString(example.title), bold: true })], spacing: SPACE_AFTER[100] }),
+          new Paragraph({ children: [new TextRun({ text: ensureString(example.code), font: "Courier New" })], spacing: SPACE_AFTER[200] })
+        ]),
 
-      ...ensureArray(procedureData.usageExamples).flatMap(example => [
-        new Paragraph({ children: [new TextRun({ text: ensureString(example.title), bold: true })], spacing: { after: 100 } }),
-        new Paragraph({ text: ensureString(example.code), font: { name: "Courier New" }, spacing: { after: 200 } })
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
       ]),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
-
-      // Section 10: Change History
-      new Paragraph({ text: "10. CHANGE HISTORY", heading: HeadingLevel.HEADING_2, spacing: { before: 400, after: 200 } }),
+      // Change History
+      sectionHeader("CHANGE HISTORY"),
 
       new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideHorizontal: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideVertical: { style: BorderStyle.SINGLE, size: 1, color: "000000" }
-        },
+        width: PERCENT_WIDTH[100],
+        borders: GRID_BORDERS,
         rows: [
           new TableRow({
             tableHeader: true,
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Date", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Author", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Ticket", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Description", bold: true })], width: { size: 55, type: WidthType.PERCENTAGE } })
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Date", bold: true })] })], width: PERCENT_WIDTH[15] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Author", bold: true })] })], width: PERCENT_WIDTH[15] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Ticket", bold: true })] })], width: PERCENT_WIDTH[15] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Description", bold: true })] })], width: PERCENT_WIDTH[55] })
             ]
           }),
-          ...ensureArray(procedureData.changeHistory).map(change =>
-            new TableRow({
-              children: [
-                new TableCell({ children: [new Paragraph(ensureString(change.date))] }),
-                new TableCell({ children: [new Paragraph(ensureString(change.author))] }),
-                new TableCell({ children: [new Paragraph(ensureString(change.ticket))] }),
-                new TableCell({ children: [new Paragraph(ensureString(change.description))] })
-              ]
-            })
-          )
+          ...changeHistoryRows.map(row => textRow(row))
         ]
       }),
 
       // Footer
-      new Paragraph({ text: "━".repeat(80), spacing: { before: 600, after: 200 } }),
-      new Paragraph({ text: "END OF DOCUMENTATION", alignment: AlignmentType.CENTER, spacing: { after: 200 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: { before: 600, after: 200 } }),
+      new Paragraph({ text: "END OF DOCUMENTATION", alignment: AlignmentType.CENTER, spacing: SPACE_AFTER[200] }),
       new Paragraph({
-        text: `Documentation Type: Tier 1 (Comprehensive) | Generated: ${new Date().toLocaleDateString()}`,
-        italics: true,
+        children: [new TextRun({ text: `Documentation Type: Tier 1 (Comprehensive) | Generated: ${new Date().toLocaleDateString()}`, italics: true })],
         alignment: AlignmentType.CENTER
       })
     ]
@@ -342,12 +359,17 @@ const doc = new Document({
 });
 
 // ===== WRITE OUTPUT FILE =====
+// Write to a sibling temp file and rename it into place, so the output path only ever holds a complete .docx
+const tempDocxPath = `${outputDocxPath}.tmp`;
+
 docx.Packer.toBuffer(doc).then((buffer) => {
-  fs.writeFileSync(outputDocxPath, buffer);
+  fs.writeFileSync(tempDocxPath, buffer);
+  fs.renameSync(tempDocxPath, outputDocxPath);
   console.log(`✅ Document created successfully: ${outputDocxPath}`);
   console.log(`📄 Template: Tier 1 (Comprehensive)`);
   console.log(`📊 Size: ${buffer.length} bytes`);
 }).catch((error) => {
+  fs.rmSync(tempDocxPath, { force: true });
   console.error(`ERROR: Failed to generate document: ${error.message}`);
   process.exit(1);
 });
@@ -44,6 +44,33 @@ try {
   process.exit(1);
 }
 
+// ===== LAYOUT CONSTANTS =====
+// Built once at load and shared by every divider paragraph
+const DIVIDER_TEXT = "━".repeat(80);
+
+// Table border sets shared by every table instead of rebuilt per table
+const BORDER_COLOR = "000000";
+const THIN_BORDER = { style: BorderStyle.SINGLE, size: 1, color: BORDER_COLOR };
+const BOX_BORDER = { style: BorderStyle.SINGLE, size: 2, color: BORDER_COLOR };
+
+const BOX_BORDERS = { top: BOX_BORDER, bottom: BOX_BORDER, left: BOX_BORDER, right: BOX_BORDER };
+
+const GRID_BORDERS = {
+  top: THIN_BORDER,
+  bottom: THIN_BORDER,
+  left: THIN_BORDER,
+  right: THIN_BORDER,
+  insideHorizontal: THIN_BORDER,
+  insideVertical: THIN_BORDER
+};
+
+// Spacing, width and bullet options reused by every paragraph, cell and table
+const SPACE_AFTER = Object.fromEntries([100, 200, 400].map(n => [n, { after: n }]));
+const PERCENT_WIDTH = Object.fromEntries([15, 20, 25, 55, 100].map(n => [n, { size: n, type: WidthType.PERCENTAGE }]));
+const BULLET = { level: 0 };
+// Bold sub-labels that follow a bullet list within a section
+const SUBHEADING_SPACING = { before: 100, after: 100 };
+
 // ===== HELPER FUNCTIONS =====
 function ensureArray(value) {
   if (!value) return [];
@@ -54,6 +81,40 @@ function ensureString(value, defaultValue = "") {
   return value !== null && value !== undefined ? String(value) : defaultValue;
 }
 
+const SECTION_HEADER_SPACING = SPACE_AFTER[200];
+
+function sectionHeader(title) {
+  return new Paragraph({
+    children: [new TextRun({ text: title, bold: true, size: 24 })],
+    spacing: SECTION_HEADER_SPACING
+  });
+}
+
+// Emits nothing for an empty list, so the section header is skipped along with its body
+function optionalSection(title, items, render) {
+  if (items.length === 0) return [];
+  return [sectionHeader(title), ...render(items)];
+}
+
+// Builds a plain data row with one single-paragraph cell per value
+function textRow(values) {
+  return new TableRow({
+    children: values.map(value => new TableCell({ children: [new Paragraph(ensureString(value))] }))
+  });
+}
+
+// ===== INPUT NORMALIZATION =====
+// Coerce list fields once, so every section below iterates plain arrays
+const dependencies = procedureData.dependencies || {};
+
+const parameterRows = ensureArray(procedureData.parameters).map(param => [param.name, param.type, param.description]);
+const executionLogic = ensureArray(procedureData.executionLogic).map(step => ensureString(step));
+const sourceTables = ensureArray(dependencies.sourceTables);
+const targetTables = ensureArray(dependencies.targetTables);
+const relatedProcedures = ensureArray(dependencies.procedures);
+const usageExamples = ensureArray(procedureData.usageExamples);
+const changeHistoryRows = ensureArray(procedureData.changeHistory).map(change => [change.date, change.author, change.ticket, change.description]);
+
 // ===== DOCUMENT GENERATION =====
 const doc = new Document({
   sections: [{
@@ -63,213 +124,156 @@ const doc = new Document({
       new Paragraph({
         children: [new TextRun({ text: "Stored Procedure Documentation", bold: true, size: 32 })],
         alignment: AlignmentType.CENTER,
-        spacing: { after: 200 }
+        spacing: SPACE_AFTER[200]
       }),
 
       new Paragraph({
         children: [new TextRun({ text: ensureString(procedureData.procedureName, "Untitled Procedure"), size: 28 })],
         alignment: AlignmentType.CENTER,
-        spacing: { after: 400 }
+        spacing: SPACE_AFTER[400]
       }),
 
       // Separator
-      new Paragraph({ text: "━".repeat(80), spacing: { after: 200 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: SPACE_AFTER[200] }),
 
       // Quick Reference Box
       new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 2, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 2, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 2, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 2, color: "000000" }
-        },
+        width: PERCENT_WIDTH[100],
+        borders: BOX_BORDERS,
         rows: [
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Schema", bold: true })], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph(ensureString(procedureData.schema))], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Type", bold: true })], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph(ensureString(procedureData.type, "SystemDoc"))], width: { size: 25, type: WidthType.PERCENTAGE } })
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Schema", bold: true })] })], width: PERCENT_WIDTH[25] }),
+              new TableCell({ children: [new Paragraph(ensureString(procedureData.schema))], width: PERCENT_WIDTH[25] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Type", bold: true })] })], width: PERCENT_WIDTH[25] }),
+              new TableCell({ children: [new Paragraph(ensureString(procedureData.type, "SystemDoc"))], width: PERCENT_WIDTH[25] })
             ]
           }),
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Author", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Author", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.author))] }),
-              new TableCell({ children: [new Paragraph({ text: "Ticket", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Ticket", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.ticket))] })
             ]
           }),
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Created", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Created", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.created))] }),
-              new TableCell({ children: [new Paragraph({ text: "Status", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Status", bold: true })] })] }),
               new TableCell({ children: [new Paragraph("Active")] })
             ]
           })
         ]
       }),
 
-      new Paragraph({ text: "━".repeat(80), spacing: { before: 200, after: 400 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: { before: 200, after: 400 } }),
 
       // Section 1: Purpose
-      new Paragraph({
-        children: [new TextRun({ text: "PURPOSE", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
-      new Paragraph({ text: ensureString(procedureData.purpose, "No description provided."), spacing: { after: 400 } }),
+      sectionHeader("PURPOSE"),
+      new Paragraph({ text: ensureString(procedureData.purpose, "No description provided."), spacing: SPACE_AFTER[400] }),
 
       // Section 2: Parameters
-      new Paragraph({
-        children: [new TextRun({ text: "PARAMETERS", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
-
-      new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideHorizontal: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideVertical: { style: BorderStyle.SINGLE, size: 1, color: "000000" }
-        },
-        rows: [
-          new TableRow({
-            tableHeader: true,
-            children: [
-              new TableCell({ children: [new Paragraph({ text: "Parameter", bold: true })], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Type", bold: true })], width: { size: 20, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Description", bold: true })], width: { size: 55, type: WidthType.PERCENTAGE } })
-            ]
-          }),
-          ...ensureArray(procedureData.parameters).map(param =>
+      ...optionalSection("PARAMETERS", parameterRows, rows => [
+        new Table({
+          width: PERCENT_WIDTH[100],
+          borders: GRID_BORDERS,
+          rows: [
             new TableRow({
+              tableHeader: true,
               children: [
-                new TableCell({ children: [new Paragraph(ensureString(param.name))] }),
-                new TableCell({ children: [new Paragraph(ensureString(param.type))] }),
-                new TableCell({ children: [new Paragraph(ensureString(param.description))] })
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Parameter", bold: true })] })], width: PERCENT_WIDTH[25] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Type", bold: true })] })], width: PERCENT_WIDTH[20] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Description", bold: true })] })], width: PERCENT_WIDTH[55] })
               ]
-            })
-          )
-        ]
-      }),
+            }),
+            ...rows.map(row => textRow(row))
+          ]
+        }),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
+      ]),
 
       // Section 3: Return Value & Output
-      new Paragraph({
-        children: [new TextRun({ text: "RETURN VALUE & OUTPUT", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
+      sectionHeader("RETURN VALUE & OUTPUT"),
       new Paragraph({
         children: [
           new TextRun({ text: "Return Value: ", bold: true }),
           new TextRun(ensureString(procedureData.returnValue, "None"))
         ],
-        spacing: { after: 100 }
+        spacing: SPACE_AFTER[100]
       }),
       new Paragraph({
         children: [
           new TextRun({ text: "Output: ", bold: true }),
           new TextRun(ensureString(procedureData.output, "N/A"))
         ],
-        spacing: { after: 400 }
+        spacing: SPACE_AFTER[400]
       }),
 
       // Section 4: Execution Logic
-      new Paragraph({
-        children: [new TextRun({ text: "EXECUTION LOGIC", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
-      ...ensureArray(procedureData.executionLogic).map(step =>
-        new Paragraph({ text: ensureString(step), bullet: { level: 0 }, spacing: { after: 100 } })
-      ),
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+      ...optionalSection("EXECUTION LOGIC", executionLogic, steps => [
+        ...steps.map(step =>
+          new Paragraph({ text: step, bullet: BULLET, spacing: SPACE_AFTER[100] })
+        ),
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
+      ]),
 
       // Section 5: Dependencies
-      new Paragraph({
-        children: [new TextRun({ text: "DEPENDENCIES", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
+      sectionHeader("DEPENDENCIES"),
 
-      new Paragraph({ children: [new TextRun({ text: "Source Tables:", bold: true })], spacing: { after: 100 } }),
-      ...ensureArray(procedureData.dependencies && procedureData.dependencies.sourceTables).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Source Tables:", bold: true })], spacing: SPACE_AFTER[100] }),
+      ...sourceTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ children: [new TextRun({ text: "Target Tables:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.dependencies && procedureData.dependencies.targetTables).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Target Tables:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...targetTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ children: [new TextRun({ text: "Related Procedures:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.dependencies && procedureData.dependencies.procedures).map(proc =>
-        new Paragraph({ text: ensureString(proc), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Related Procedures:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...relatedProcedures.map(proc =>
+        new Paragraph({ text: ensureString(proc), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+      new Paragraph({ text: "", spacing: SPACE_AFTER[400] }),
 
       // Section 6: Usage Examples
-      new Paragraph({
-        children: [new TextRun({ text: "USAGE EXAMPLES", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
+      ...optionalSection("USAGE EXAMPLES", usageExamples, examples => [
+        ...examples.flatMap(example => [
+          new Paragraph({ children: [new TextRun({ text: ensureString(example.title), bold: true })], spacing: SPACE_AFTER[100] }),
+          new Paragraph({ children: [new TextRun({ text: ensureString(example.code), font: "Courier New" })], spacing: SPACE_AFTER[200] })
+        ]),
 
-      ...ensureArray(procedureData.usageExamples).flatMap(example => [
-        new Paragraph({ children: [new TextRun({ text: ensureString(example.title), bold: true })], spacing: { after: 100 } }),
-        new Paragraph({ text: ensureString(example.code), font: { name: "Courier New" }, spacing: { after: 200 } })
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
       ]),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
-
       // Section 7: Change History
-      new Paragraph({
-        children: [new TextRun({ text: "CHANGE HISTORY", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
+      sectionHeader("CHANGE HISTORY"),
 
       new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideHorizontal: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideVertical: { style: BorderStyle.SINGLE, size: 1, color: "000000" }
-        },
+        width: PERCENT_WIDTH[100],
+        borders: GRID_BORDERS,
         rows: [
           new TableRow({
             tableHeader: true,
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Date", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Author", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Ticket", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Description", bold: true })], width: { size: 55, type: WidthType.PERCENTAGE } })
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Date", bold: true })] })], width: PERCENT_WIDTH[15] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Author", bold: true })] })], width: PERCENT_WIDTH[15] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Ticket", bold: true })] })], width: PERCENT_WIDTH[15] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Description", bold: true })] })], width: PERCENT_WIDTH[55] })
             ]
           }),
-          ...ensureArray(procedureData.changeHistory).map(change =>
-            new TableRow({
-              children: [
-                new TableCell({ children: [new Paragraph(ensureString(change.date))] }),
-                new TableCell({ children: [new Paragraph(ensureString(change.author))] }),
-                new TableCell({ children: [new Paragraph(ensureString(change.ticket))] }),
-                new TableCell({ children: [new Paragraph(ensureString(change.description))] })
-              ]
-            })
-          )
+          ...changeHistoryRows.map(row => textRow(row))
         ]
       }),
 
       // Footer
-      new Paragraph({ text: "━".repeat(80), spacing: { before: 600, after: 200 } }),
-      new Paragraph({ text: "END OF DOCUMENTATION", alignment: AlignmentType.CENTER, spacing: { after: 200 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: { before: 600, after: 200 } }),
+      new Paragraph({ text: "END OF DOCUMENTATION", alignment: AlignmentType.CENTER, spacing: SPACE_AFTER[200] }),
       new Paragraph({
-        text: `Documentation Type: Tier 2 (Standard) | Generated: ${new Date().toLocaleDateString()}`,
-        italics: true,
+        children: [new TextRun({ text: `Documentation Type: Tier 2 (Standard) | Generated: ${new Date().toLocaleDateString()}`, italics: true })],
         alignment: AlignmentType.CENTER
       })
     ]
@@ -277,12 +281,17 @@ const doc = new Document({
 });
 
 // ===== WRITE OUTPUT FILE =====
+// Write to a sibling temp file and rename it into place, so the output path only ever holds a complete .docx
+const tempDocxPath = `${outputDocxPath}.tmp`;
+
 docx.Packer.toBuffer(doc).then((buffer) => {
-  fs.writeFileSync(outputDocxPath, buffer);
+  fs.writeFileSync(tempDocxPath, buffer);
+  fs.renameSync(tempDocxPath, outputDocxPath);
   console.log(`✅ Document created successfully: ${outputDocxPath}`);
   console.log(`📄 Template: Tier 2 (Standard)`);
   console.log(`📊 Size: ${buffer.length} bytes`);
 }).catch((error) => {
+  fs.rmSync(tempDocxPath, { force: true });
   console.error(`ERROR: Failed to generate document: ${error.message}`);
   process.exit(1);
 });
@@ -44,6 +44,33 @@ try {
   process.exit(1);
 }
 
+// ===== LAYOUT CONSTANTS =====
+// Built once at load and shared by every divider paragraph
+const DIVIDER_TEXT = "━".repeat(80);
+
+// Table border sets shared by every table instead of rebuilt per table
+const BORDER_COLOR = "000000";
+const THIN_BORDER = { style: BorderStyle.SINGLE, size: 1, color: BORDER_COLOR };
+const BOX_BORDER = { style: BorderStyle.SINGLE, size: 2, color: BORDER_COLOR };
+
+const BOX_BORDERS = { top: BOX_BORDER, bottom: BOX_BORDER, left: BOX_BORDER, right: BOX_BORDER };
+
+const GRID_BORDERS = {
+  top: THIN_BORDER,
+  bottom: THIN_BORDER,
+  left: THIN_BORDER,
+  right: THIN_BORDER,
+  insideHorizontal: THIN_BORDER,
+  insideVertical: THIN_BORDER
+};
+
+// Spacing, width and bullet options reused by every paragraph, cell and table
+const SPACE_AFTER = Object.fromEntries([100, 200, 400].map(n => [n, { after: n }]));
+const PERCENT_WIDTH = Object.fromEntries([15, 25, 60, 100].map(n => [n, { size: n, type: WidthType.PERCENTAGE }]));
+const BULLET = { level: 0 };
+// Bold sub-labels that follow a bullet list within a section
+const SUBHEADING_SPACING = { before: 100, after: 100 };
+
 // ===== HELPER FUNCTIONS =====
 function ensureArray(value) {
   if (!value) return [];
@@ -54,6 +81,41 @@ function ensureString(value, defaultValue = "") {
   return value !== null && value !== undefined ? String(value) : defaultValue;
 }
 
+const SECTION_HEADER_SPACING = SPACE_AFTER[200];
+
+function sectionHeader(title) {
+  return new Paragraph({
+    children: [new TextRun({ text: title, bold: true, size: 24 })],
+    spacing: SECTION_HEADER_SPACING
+  });
+}
+
+// Emits nothing for an empty list, so the section header is skipped along with its body
+function optionalSection(title, items, render) {
+  if (items.length === 0) return [];
+  return [sectionHeader(title), ...render(items)];
+}
+
+// Builds a plain data row with one single-paragraph cell per value
+function textRow(values) {
+  return new TableRow({
+    children: values.map(value => new TableCell({ children: [new Paragraph(ensureString(value))] }))
+  });
+}
+
+// ===== INPUT NORMALIZATION =====
+// Coerce list fields once, so every section below iterates plain arrays
+const dependencies = procedureData.dependencies || {};
+const exceptionHandling = procedureData.exceptionHandling || {};
+
+const parameterRows = ensureArray(procedureData.parameters).map(param => [param.name, param.type, param.description]);
+const validationRules = ensureArray(procedureData.validationRules);
+const usageExamples = ensureArray(procedureData.usageExamples);
+const sourceTables = ensureArray(dependencies.sourceTables);
+const controlTables = ensureArray(dependencies.controlTables);
+const outputTables = ensureArray(dependencies.outputTables);
+const executionLogic = ensureArray(procedureData.executionLogic).map(step => ensureString(step));
+
 // ===== DOCUMENT GENERATION =====
 const doc = new Document({
   sections: [{
@@ -63,205 +125,164 @@ const doc = new Document({
       new Paragraph({
         children: [new TextRun({ text: "QA Procedure Documentation", bold: true, size: 32 })],
         alignment: AlignmentType.CENTER,
-        spacing: { after: 200 }
+        spacing: SPACE_AFTER[200]
       }),
 
       new Paragraph({
         children: [new TextRun({ text: ensureString(procedureData.procedureName, "Untitled Procedure"), size: 28 })],
         alignment: AlignmentType.CENTER,
-        spacing: { after: 400 }
+        spacing: SPACE_AFTER[400]
       }),
 
       // Separator
-      new Paragraph({ text: "━".repeat(80), spacing: { after: 200 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: SPACE_AFTER[200] }),
 
       // Quick Reference Box
       new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 2, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 2, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 2, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 2, color: "000000" }
-        },
+        width: PERCENT_WIDTH[100],
+        borders: BOX_BORDERS,
         rows: [
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Schema", bold: true })], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph(ensureString(procedureData.schema))], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Type", bold: true })], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph(ensureString(procedureData.type, "Data Quality Check"))], width: { size: 25, type: WidthType.PERCENTAGE } })
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Schema", bold: true })] })], width: PERCENT_WIDTH[25] }),
+              new TableCell({ children: [new Paragraph(ensureString(procedureData.schema))], width: PERCENT_WIDTH[25] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Type", bold: true })] })], width: PERCENT_WIDTH[25] }),
+              new TableCell({ children: [new Paragraph(ensureString(procedureData.type, "Data Quality Check"))], width: PERCENT_WIDTH[25] })
             ]
           }),
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Author", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Author", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.author))] }),
-              new TableCell({ children: [new Paragraph({ text: "Created", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Created", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.created))] })
             ]
           }),
           new TableRow({
             children: [
-              new TableCell({ children: [new Paragraph({ text: "Validates", bold: true })] }),
+              new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Validates", bold: true })] })] }),
               new TableCell({ children: [new Paragraph(ensureString(procedureData.validates, "N/A"))], columnSpan: 3 })
             ]
           })
         ]
       }),
 
-      new Paragraph({ text: "━".repeat(80), spacing: { before: 200, after: 400 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: { before: 200, after: 400 } }),
 
       // Purpose
-      new Paragraph({
-        children: [new TextRun({ text: "PURPOSE", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
-      new Paragraph({ text: ensureString(procedureData.purpose, "No description provided."), spacing: { after: 400 } }),
+      sectionHeader("PURPOSE"),
+      new Paragraph({ text: ensureString(procedureData.purpose, "No description provided."), spacing: SPACE_AFTER[400] }),
 
       // Parameters
-      new Paragraph({
-        children: [new TextRun({ text: "PARAMETERS", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
-
-      new Table({
-        width: { size: 100, type: WidthType.PERCENTAGE },
-        borders: {
-          top: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          bottom: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          left: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          right: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideHorizontal: { style: BorderStyle.SINGLE, size: 1, color: "000000" },
-          insideVertical: { style: BorderStyle.SINGLE, size: 1, color: "000000" }
-        },
-        rows: [
-          new TableRow({
-            tableHeader: true,
-            children: [
-              new TableCell({ children: [new Paragraph({ text: "Parameter", bold: true })], width: { size: 25, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Type", bold: true })], width: { size: 15, type: WidthType.PERCENTAGE } }),
-              new TableCell({ children: [new Paragraph({ text: "Description", bold: true })], width: { size: 60, type: WidthType.PERCENTAGE } })
-            ]
-          }),
-          ...ensureArray(procedureData.parameters).map(param =>
+      ...optionalSection("PARAMETERS", parameterRows, rows => [
+        new Table({
+          width: PERCENT_WIDTH[100],
+          borders: GRID_BORDERS,
+          rows: [
             new TableRow({
+              tableHeader: true,
               children: [
-                new TableCell({ children: [new Paragraph(ensureString(param.name))] }),
-                new TableCell({ children: [new Paragraph(ensureString(param.type))] }),
-                new TableCell({ children: [new Paragraph(ensureString(param.description))] })
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Parameter", bold: true })] })], width: PERCENT_WIDTH[25] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Type", bold: true })] })], width: PERCENT_WIDTH[15] }),
+                new TableCell({ children: [new Paragraph({ children: [new TextRun({ text: "Description", bold: true })] })], width: PERCENT_WIDTH[60] })
               ]
-            })
-          )
-        ]
-      }),
+            }),
+            ...rows.map(row => textRow(row))
+          ]
+        }),
 
-      new Paragraph({ text: "", spacing: { after: 400 } }),
+        new Paragraph({ text: "", spacing: SPACE_AFTER[400] })
+      ]),
 
       // Validation Rules
-      new Paragraph({
-        children: [new TextRun({ text: "VALIDATION RULES", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
-
-      ...ensureArray(procedureData.validationRules).flatMap(rule => [
-        new Paragraph({ children: [new TextRun({ text: ensureString(rule.title), bold: true })], spacing: { after: 100 } }),
-        ...ensureArray(rule.checks).map(check =>
-          new Paragraph({ text: ensureString(check), bullet: { level: 0 }, spacing: { after: 100 } })
-        ),
-        new Paragraph({ text: "", spacing: { after: 100 } })
+      ...optionalSection("VALIDATION RULES", validationRules, rules => [
+        ...rules.flatMap(rule => [
+          new Paragraph({ children: [new TextRun({ text: ensureString(rule.title), bold: true })], spacing: SPACE_AFTER[100] }),
+          ...ensureArray(rule.checks).map(check =>
+            new Paragraph({ text: ensureString(check), bullet: BULLET, spacing: SPACE_AFTER[100] })
+          ),
+          new Paragraph({ text: "", spacing: SPACE_AFTER[100] })
+        ]),
+
+        new Paragraph({ text: "", spacing: SPACE_AFTER[200] })
       ]),
 
-      new Paragraph({ text: "", spacing: { after: 200 } }),
-
       // Exception Handling
-      new Paragraph({
-        children: [new TextRun({ text: "EXCEPTION HANDLING", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
+      sectionHeader("EXCEPTION HANDLING"),
 
       new Paragraph({
         children: [
           new TextRun({ text: "Exceptions logged to: ", bold: true }),
-          new TextRun(ensureString(procedureData.exceptionHandling && procedureData.exceptionHandling.exceptionsLoggedTo, "N/A"))
+          new TextRun(ensureString(exceptionHandling.exceptionsLoggedTo, "N/A"))
         ],
-        spacing: { after: 100 }
+        spacing: SPACE_AFTER[100]
       }),
 
       new Paragraph({
         children: [
           new TextRun({ text: "Execution logged to: ", bold: true }),
-          new TextRun(ensureString(procedureData.exceptionHandling && procedureData.exceptionHandling.executionLoggedTo, "N/A"))
+          new TextRun(ensureString(exceptionHandling.executionLoggedTo, "N/A"))
         ],
-        spacing: { after: 100 }
+        spacing: SPACE_AFTER[100]
       }),
 
       new Paragraph({
         children: [
           new TextRun({ text: "Processing: ", bold: true }),
-          new TextRun(ensureString(procedureData.exceptionHandling && procedureData.exceptionHandling.processing, "N/A"))
+          new TextRun(ensureString(exceptionHandling.processing, "N/A"))
         ],
-        spacing: { after: 100 }
+        spacing: SPACE_AFTER[100]
       }),
 
       new Paragraph({
         children: [
           new TextRun({ text: "Cleanup: ", bold: true }),
-          new TextRun(ensureString(procedureData.exceptionHandling && procedureData.exceptionHandling.cleanup, "N/A"))
+          new TextRun(ensureString(exceptionHandling.cleanup, "N/A"))
         ],
-        spacing: { after: 400 }
+        spacing: SPACE_AFTER[400]
       }),
 
       // Usage Examples
-      new Paragraph({
-        children: [new TextRun({ text: "USAGE EXAMPLES", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
+      ...optionalSection("USAGE EXAMPLES", usageExamples, examples => [
+        ...examples.flatMap(example => [
+          new Paragraph({ children: [new TextRun({ text: ensureString(example.title), bold: true })], spacing: SPACE_AFTER[100] }),
+          new Paragraph({ children: [new TextRun({ text: ensureString(example.code), font: "Courier New" })], spacing: SPACE_AFTER[200] })
+        ]),
 
-      ...ensureArray(procedureData.usageExamples).flatMap(example => [
-        new Paragraph({ children: [new TextRun({ text: ensureString(example.title), bold: true })], spacing: { after: 100 } }),
-        new Paragraph({ text: ensureString(example.code), font: { name: "Courier New" }, spacing: { after: 200 } })
+        new Paragraph({ text: "", spacing: SPACE_AFTER[200] })
       ]),
 
-      new Paragraph({ text: "", spacing: { after: 200 } }),
-
       // Dependencies
-      new Paragraph({
-        children: [new TextRun({ text: "DEPENDENCIES", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
+      sectionHeader("DEPENDENCIES"),
 
-      new Paragraph({ children: [new TextRun({ text: "Source Tables:", bold: true })], spacing: { after: 100 } }),
-      ...ensureArray(procedureData.dependencies && procedureData.dependencies.sourceTables).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Source Tables:", bold: true })], spacing: SPACE_AFTER[100] }),
+      ...sourceTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ children: [new TextRun({ text: "Control Tables:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.dependencies && procedureData.dependencies.controlTables).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Control Tables:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...controlTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ children: [new TextRun({ text: "Output Tables:", bold: true })], spacing: { after: 100, before: 100 } }),
-      ...ensureArray(procedureData.dependencies && procedureData.dependencies.outputTables).map(table =>
-        new Paragraph({ text: ensureString(table), bullet: { level: 0 }, spacing: { after: 100 } })
+      new Paragraph({ children: [new TextRun({ text: "Output Tables:", bold: true })], spacing: SUBHEADING_SPACING }),
+      ...outputTables.map(table =>
+        new Paragraph({ text: ensureString(table), bullet: BULLET, spacing: SPACE_AFTER[100] })
       ),
 
-      new Paragraph({ text: "", spacing: { after: 200 } }),
+      new Paragraph({ text: "", spacing: SPACE_AFTER[200] }),
 
       // Execution Logic
-      new Paragraph({
-        children: [new TextRun({ text: "EXECUTION LOGIC (HIGH-LEVEL)", bold: true, size: 24 })],
-        spacing: { after: 200 }
-      }),
-
-      new Paragraph({ text: "For each period in the range:", spacing: { after: 100 } }),
-      ...ensureArray(procedureData.executionLogic).map(step =>
-        new Paragraph({ text: ensureString(step), bullet: { level: 0 }, spacing: { after: 100 } })
-      ),
+      ...optionalSection("EXECUTION LOGIC (HIGH-LEVEL)", executionLogic, steps => [
+        new Paragraph({ text: "For each period in the range:", spacing: SPACE_AFTER[100] }),
+        ...steps.map(step =>
+          new Paragraph({ text: step, bullet: BULLET, spacing: SPACE_AFTER[100] })
+        )
+      ]),
 
       // Footer
-      new Paragraph({ text: "━".repeat(80), spacing: { before: 400, after: 200 } }),
-      new Paragraph({ text: "END OF DOCUMENTATION", alignment: AlignmentType.CENTER, spacing: { after: 200 } }),
+      new Paragraph({ text: DIVIDER_TEXT, spacing: { before: 400, after: 200 } }),
+      new Paragraph({ text: "END OF DOCUMENTATION", alignment: AlignmentType.CENTER, spacing: SPACE_AFTER[200] }),
       new Paragraph({
         children: [new TextRun({
           text: `Documentation Type: Tier 3 (Lightweight) | Generated: ${new Date().toLocaleDateString()}`,
@@ -275,12 +296,17 @@ const doc = new Document({
 });
 
 // ===== WRITE OUTPUT FILE =====
+// Write to a sibling temp file and rename it into place, so the output path only ever holds a complete .docx
+const tempDocxPath = `${outputDocxPath}.tmp`;
+
 docx.Packer.toBuffer(doc).then((buffer) => {
-  fs.writeFileSync(outputDocxPath, buffer);
+  fs.writeFileSync(tempDocxPath, buffer);
+  fs.renameSync(tempDocxPath, outputDocxPath);
   console.log(`✅ Document created successfully: ${outputDocxPath}`);
   console.log(`📄 Template: Tier 3 (Lightweight)`);
   console.log(`📊 Size: ${buffer.length} bytes`);
 }).catch((error) => {
+  fs.rmSync(tempDocxPath, { force: true });
   console.error(`ERROR: Failed to generate document: ${error.message}`);
   process.exit(1);
 });